@@ -51,4 +51,6 @@ def flood_fill(image, sr, sc, new_color):
 #Worst case: queue might contain almost all cells at once (e.g., if everything is connected).
 # O(N×M) space in the worst case.
 
-# 1 flood fill
\ No newline at end of file
+# 1 flood fill
+# For large images see connected_components.py: scanline_flood_fill() fills whole
+# row spans per stack entry, label_components() labels every region at once.
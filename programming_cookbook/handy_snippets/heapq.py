@@ -31,3 +31,8 @@
 
 # print(top_k_frequent_items([1,1,1,2,2,3], 2))  # [1, 2]
 
+
+
+# heapq has no decrease-key (update the priority of an item already in the heap).
+# For graph searches see path_finding/indexed_heap.py: an indexed binary heap
+# with decrease_key and a radix heap for monotone integer keys.
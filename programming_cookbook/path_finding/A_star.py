@@ -1,6 +1,11 @@
 import heapq
 
-def a_star(graph, start, goal, h):
+from indexed_heap import IndexedHeap
+
+def a_star(graph, start, goal, h, queue=None):
+    # queue='indexed': indexed heap with decrease-key instead of duplicate heapq entries
+    if queue == 'indexed':
+        return _a_star_indexed(graph, start, goal, h)
     open_set = []
     heapq.heappush(open_set, (h(start, goal), start))
     came_from = {}
@@ -26,6 +31,35 @@ def a_star(graph, start, goal, h):
                 heapq.heappush(open_set, (f_score, neighbor))
     return None
 
+def _a_star_indexed(graph, start, goal, h):
+    nodes = list(graph)
+    ids = {node: i for i, node in enumerate(nodes)}
+    open_set = IndexedHeap(len(nodes))
+    open_set.push(ids[start], h(start, goal))
+    came_from = {}
+    g_score = {node: float('inf') for node in graph}
+    g_score[start] = 0
+
+    while open_set:
+        _, i = open_set.pop()
+        current = nodes[i]
+        if current == goal:
+            path = []
+            while current in came_from:
+                path.append(current)
+                current = came_from[current]
+            path.append(start)
+            return path[::-1]
+
+        for neighbor, weight in graph[current]:
+            tentative_g = g_score[current] + weight
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                # re-inserts the neighbor if it was already closed
+                open_set.push_or_decrease(ids[neighbor], tentative_g + h(neighbor, goal))
+    return None
+
 def heuristic(node, goal):
     return 0  # for simple Dijkstra-like behavior
 
@@ -37,7 +71,8 @@ graph_w = {
     'D': []
 }
 
-print(a_star(graph_w, 'A', 'D', heuristic))  # ['A', 'B', 'C', 'D']
+if __name__ == "__main__":
+    print(a_star(graph_w, 'A', 'D', heuristic))  # ['A', 'B', 'C', 'D']
 
 
 # A Algorithm* (Heuristic search) Approach: 
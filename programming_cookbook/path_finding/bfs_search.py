@@ -24,7 +24,8 @@ graph = {
     'F': []
 }
 
-print(bfs(graph, 'A', 'E'))  # True
+if __name__ == "__main__":
+    print(bfs(graph, 'A', 'E'))  # True
 
 
 
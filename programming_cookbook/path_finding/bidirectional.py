@@ -0,0 +1,173 @@
+# Bidirectional Dijkstra / A*:
+# Run one search forward from the source on the graph and one backward from
+# the target on the reversed graph, until the two search balls meet.
+# In a road-like graph a ball of radius r contains ~r² nodes, so two balls
+# of radius r/2 settle about half the nodes of one ball of radius r
+# (and far fewer on graphs that grow faster than r²).
+
+# Stopping criterion:
+# mu = best s -> v -> t length seen so far (updated when an edge reaches a node
+# already labelled by the other side). It is NOT enough to stop when the same node
+# is settled on both sides, the shortest path can go through a different node.
+# Stop when top_forward + top_backward >= mu: any path not seen yet has to leave
+# both balls, so it is at least top_forward + top_backward long.
+
+# Bidirectional A*:
+# The heuristic changes edge weights to w(u, v) - p(u) + p(v), both searches must
+# use the same reduced weights, so the "average" potential is used:
+#     p_f(v) = (h_f(v) - h_b(v)) / 2,   p_b(v) = -p_f(v)
+# h_f(v) estimates dist(v, goal), h_b(v) estimates dist(start, v).
+# With p_f the same stopping criterion works on the keys of the two heaps.
+
+import heapq
+from collections import OrderedDict
+
+from dijkstra import dijkstra, reconstruct_path
+from A_star import a_star
+
+
+# Reversed adjacency, cached per graph object so repeated queries on the same
+# graph don't rebuild it. Call clear_reverse_cache() after mutating a graph.
+# A dict can't be weakly referenced, so the cache holds the graphs strongly;
+# it is a small LRU to bound what it keeps alive. Callers that hold many
+# graphs can build the reverse themselves and pass it as reverse=.
+_REVERSE_CACHE_SIZE = 4
+_reverse_cache = OrderedDict()
+
+
+def reverse_graph(graph):
+    cached = _reverse_cache.get(id(graph))
+    if cached is not None and cached[0] is graph:
+        _reverse_cache.move_to_end(id(graph))
+        return cached[1]
+
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    # keep a reference to graph so its id can't be reused by another object
+    _reverse_cache[id(graph)] = (graph, reverse)
+    _reverse_cache.move_to_end(id(graph))
+    while len(_reverse_cache) > _REVERSE_CACHE_SIZE:
+        _reverse_cache.popitem(last=False)
+    return reverse
+
+
+def clear_reverse_cache(graph=None):
+    if graph is None:
+        _reverse_cache.clear()
+    else:
+        _reverse_cache.pop(id(graph), None)
+
+
+def _bidirectional(graph, start, goal, potential, reverse):
+    if start == goal:
+        return 0, [start]
+
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    # side 0 = forward on graph, side 1 = backward on reverse
+    adjacency = (graph, reverse)
+    dist = ({start: 0}, {goal: 0})
+    prev = ({start: None}, {goal: None})
+    sign = (1, -1)
+    heaps = ([(potential(start), 0, start)], [(-potential(goal), 0, goal)])
+
+    mu = float('inf')
+    meeting = None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        # expand the side with the smaller heap key
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+        _, current_dist, node = heapq.heappop(heaps[side])
+        if current_dist > dist[side][node]:
+            continue  # stale entry
+
+        for neighbor, weight in adjacency[side].get(node, ()):
+            new_dist = current_dist + weight
+            if new_dist < dist[side].get(neighbor, float('inf')):
+                dist[side][neighbor] = new_dist
+                prev[side][neighbor] = node
+                key = new_dist + sign[side] * potential(neighbor)
+                heapq.heappush(heaps[side], (key, new_dist, neighbor))
+                if neighbor in dist[other] and new_dist + dist[other][neighbor] < mu:
+                    mu = new_dist + dist[other][neighbor]
+                    meeting = neighbor
+
+    if meeting is None:
+        return float('inf'), None
+    # start -> meeting from the forward tree, meeting -> goal from the backward tree
+    path = reconstruct_path(prev[0], meeting)
+    node = prev[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = prev[1][node]
+    return mu, path
+
+
+def bidirectional_dijkstra(graph, start, goal, reverse=None):
+    """
+    :param graph: dict-of-lists graph, same format as dijkstra()
+    :param reverse: reverse_graph(graph), if the caller keeps it (default: cached)
+    :return: (distance, path), (inf, None) if goal is unreachable
+    """
+    return _bidirectional(graph, start, goal, lambda node: 0, reverse)
+
+
+def bidirectional_a_star(graph, start, goal, h, h_back=None, reverse=None):
+    """
+    :param h: h(node, goal), same heuristic as a_star(); must be consistent
+    :param h_back: h_back(start, node), lower bound of dist(start, node);
+                   defaults to h(node, start), which is right for symmetric
+                   heuristics such as straight-line distance
+    :param reverse: reverse_graph(graph), if the caller keeps it (default: cached)
+    :return: (distance, path), (inf, None) if goal is unreachable
+    """
+    if h_back is None:
+        h_back = lambda source, node: h(node, source)
+
+    def potential(node):
+        return (h(node, goal) - h_back(start, node)) / 2
+
+    return _bidirectional(graph, start, goal, potential, reverse)
+
+
+if __name__ == "__main__":
+    graph_w = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 5)],
+        'C': [('D', 1)],
+        'D': []
+    }
+    print(bidirectional_dijkstra(graph_w, 'A', 'D'))  # (4, ['A', 'B', 'C', 'D'])
+
+    # Grid graph with straight-line (Euclidean) heuristic
+    import math
+    import random
+    random.seed(0)
+    size = 60
+    grid = {}
+    for x in range(size):
+        for y in range(size):
+            grid[(x, y)] = [((x + dx, y + dy), random.uniform(1, 2))
+                            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                            if 0 <= x + dx < size and 0 <= y + dy < size]
+    euclid = lambda u, v: math.dist(u, v)
+    s, t = (0, 0), (size - 1, size - 1)
+    print(round(dijkstra(grid, s, target=t)[t], 6),
+          round(bidirectional_dijkstra(grid, s, t)[0], 6),
+          round(bidirectional_a_star(grid, s, t, euclid)[0], 6))  # all equal
+    print(a_star(grid, s, t, euclid) == bidirectional_a_star(grid, s, t, euclid)[1])
+
+    # the cache keeps at most _REVERSE_CACHE_SIZE graphs alive
+    for _ in range(10):
+        bidirectional_dijkstra({0: [(1, 1)], 1: []}, 0, 1)
+    print(len(_reverse_cache))  # 4
+
+
+# Time Complexity: O((V + E) log V) in the worst case, like Dijkstra,
+# but typically settles a fraction of the nodes of a one-sided search.
+# reverse_graph(): O(V + E) once per graph, O(1) afterwards while the graph is
+# among the last _REVERSE_CACHE_SIZE graphs used.
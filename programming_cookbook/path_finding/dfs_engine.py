@@ -0,0 +1,178 @@
+# Explicit-stack DFS over a CSR graph:
+# dfs() in dfs_search.py and recursion/dfs.py use one Python frame per node on
+# the current path, so a path longer than sys.getrecursionlimit() (1000 by
+# default) raises RecursionError. Here the call stack is replaced by a list of
+# nodes plus next_edge[u], the position of the next unexplored edge of u in the
+# CSR targets array: "recursing" pushes a node, "returning" pops it.
+
+# On top of the same loop:
+#   - preorder / postorder (discovery and finish order),
+#   - topological sort = reverse postorder, a back edge (to a node still on the
+#     stack) means a cycle,
+#   - Tarjan's strongly connected components: index[u] = discovery number,
+#     low[u] = smallest index reachable from u's subtree through one back/cross
+#     edge into the Tarjan stack; u is the root of an SCC when low[u] == index[u].
+# Results are NumPy arrays indexed by node id.
+
+import numpy as np
+
+
+def dfs_order(g, start=None):
+    """
+    :param start: node label, or None to cover every node (DFS forest)
+    :return: (preorder, postorder) int64 arrays of node ids
+    """
+    n = g.num_nodes
+    offsets = g.offsets.tolist()
+    targets = g.targets.tolist()
+    next_edge = offsets[:-1]
+    visited = bytearray(n)
+    preorder, postorder = [], []
+
+    roots = [g.node_id(start)] if start is not None else range(n)
+    for root in roots:
+        if visited[root]:
+            continue
+        visited[root] = 1
+        preorder.append(root)
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            i = next_edge[u]
+            if i < offsets[u + 1]:
+                next_edge[u] = i + 1
+                v = targets[i]
+                if not visited[v]:
+                    visited[v] = 1
+                    preorder.append(v)
+                    stack.append(v)
+            else:
+                stack.pop()
+                postorder.append(u)
+    return np.array(preorder, dtype=np.int64), np.array(postorder, dtype=np.int64)
+
+
+def topological_sort(g):
+    """
+    :return: int64 array of node ids, every edge u -> v has u before v
+    :raises ValueError: if the graph has a cycle
+    """
+    n = g.num_nodes
+    offsets = g.offsets.tolist()
+    targets = g.targets.tolist()
+    next_edge = offsets[:-1]
+    # 0 = unvisited, 1 = on the stack, 2 = finished
+    state = bytearray(n)
+    postorder = []
+
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            i = next_edge[u]
+            if i < offsets[u + 1]:
+                next_edge[u] = i + 1
+                v = targets[i]
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append(v)
+                elif state[v] == 1:
+                    raise ValueError("graph has a cycle through node %r" % (g.label(v),))
+            else:
+                stack.pop()
+                state[u] = 2
+                postorder.append(u)
+    return np.array(postorder[::-1], dtype=np.int64)
+
+
+def tarjan_scc(g):
+    """
+    :return: (labels, count): labels[u] = component id of node u, ids are in
+             reverse topological order of the condensation (sinks first)
+    """
+    n = g.num_nodes
+    offsets = g.offsets.tolist()
+    targets = g.targets.tolist()
+    next_edge = offsets[:-1]
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    labels = [-1] * n
+    scc_stack = []
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            i = next_edge[u]
+            if i < offsets[u + 1]:
+                next_edge[u] = i + 1
+                v = targets[i]
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    scc_stack.append(v)
+                    on_stack[v] = 1
+                    stack.append(v)
+                elif on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                stack.pop()
+                if stack and low[u] < low[stack[-1]]:
+                    low[stack[-1]] = low[u]  # "return" low[u] to the parent
+                if low[u] == index[u]:
+                    # u is the root of an SCC: pop it off the Tarjan stack
+                    while True:
+                        v = scc_stack.pop()
+                        on_stack[v] = 0
+                        labels[v] = count
+                        if v == u:
+                            break
+                    count += 1
+    return np.array(labels, dtype=np.int64), count
+
+
+if __name__ == "__main__":
+    import sys
+    from csr_graph import CSRGraph
+
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': [],
+        'F': []
+    }
+    g = CSRGraph.from_dict(graph)
+    pre, post = dfs_order(g, 'A')
+    print([g.label(u) for u in pre])    # ['A', 'B', 'D', 'E', 'C', 'F']
+    print([g.label(u) for u in post])   # ['D', 'E', 'B', 'F', 'C', 'A']
+    print([g.label(u) for u in topological_sort(g)])  # ['A', 'C', 'F', 'B', 'E', 'D']
+
+    cyclic = CSRGraph.from_dict({1: [2], 2: [3], 3: [1, 4], 4: [5], 5: [4]})
+    labels, count = tarjan_scc(cyclic)
+    print(count, dict(zip(cyclic.labels, labels.tolist())))  # 2 {1: 1, 2: 1, 3: 1, 4: 0, 5: 0}
+
+    # a path of 10^6 nodes, far deeper than the recursion limit
+    n = 1_000_000
+    # node i -> i + 1, the last node has no out-edge
+    path = CSRGraph(np.minimum(np.arange(n + 1), n - 1), np.arange(1, n, dtype=np.int32),
+                    np.ones(n - 1))
+    print(sys.getrecursionlimit(), len(dfs_order(path, 0)[1]), tarjan_scc(path)[1])
+    # 1000 1000000 1000000
+
+
+# Time Complexity: O(V + E) for every function.
+# Space Complexity: O(V) for the stacks and per-node arrays.
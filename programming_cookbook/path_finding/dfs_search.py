@@ -18,7 +18,8 @@ graph = {
     'E': [],
     'F': []
 }
-print(dfs(graph, 'A', 'E'))  # True
+if __name__ == "__main__":
+    print(dfs(graph, 'A', 'E'))  # True
 
 
 
@@ -16,26 +16,160 @@
 
 
 import heapq
-def dijkstra(graph, start):
+
+from indexed_heap import IndexedHeap, RadixHeap
+
+def dijkstra(graph, start, target=None, with_prev=False, queue=None):
+    """
+    :param target: if given, stop as soon as target is settled (point-to-point mode).
+                   dist is then exact only for settled nodes, upper bounds otherwise.
+    :param with_prev: also return prev, the predecessor of each reached node
+    :param queue: None for heapq, 'indexed' for an indexed heap with decrease-key,
+                  'radix' for a radix heap (integer weights only)
+    :return: dist, or (dist, prev) if with_prev
+    """
+    if queue is not None:
+        return _dijkstra_queue(graph, start, target, with_prev, queue)
     dist = {node: float('inf') for node in graph}
     dist[start] = 0
+    prev = {start: None}
     heap = [(0, start)]
     
     while heap:
         current_dist, node = heapq.heappop(heap)
+        if current_dist > dist[node]:
+            # stale entry: node was pushed again with a smaller distance
+            # and has already been expanded (lazy deletion)
+            continue
+        if node == target:
+            break
         for neighbor, weight in graph[node]:
             if current_dist + weight < dist[neighbor]:
                 dist[neighbor] = current_dist + weight
+                prev[neighbor] = node
                 heapq.heappush(heap, (dist[neighbor], neighbor))
+    if with_prev:
+        return dist, prev
+    return dist
+
+def _dijkstra_queue(graph, start, target, with_prev, queue):
+    nodes = list(graph)
+    ids = {node: i for i, node in enumerate(nodes)}
+    dist = {node: float('inf') for node in graph}
+    dist[start] = 0
+    prev = {start: None}
+
+    if queue == 'indexed':
+        # every node is in the heap at most once, improvements use decrease-key
+        heap = IndexedHeap(len(nodes))
+        heap.push(ids[start], 0)
+        while heap:
+            current_dist, i = heap.pop()
+            node = nodes[i]
+            if node == target:
+                break
+            for neighbor, weight in graph[node]:
+                if current_dist + weight < dist[neighbor]:
+                    dist[neighbor] = current_dist + weight
+                    prev[neighbor] = node
+                    heap.push_or_decrease(ids[neighbor], dist[neighbor])
+    elif queue == 'radix':
+        heap = RadixHeap()
+        heap.push(0, start)
+        while heap:
+            current_dist, node = heap.pop()
+            if current_dist > dist[node]:
+                continue  # stale entry
+            if node == target:
+                break
+            for neighbor, weight in graph[node]:
+                if current_dist + weight < dist[neighbor]:
+                    dist[neighbor] = current_dist + weight
+                    prev[neighbor] = node
+                    heap.push(dist[neighbor], neighbor)
+    else:
+        raise ValueError("unknown queue: %r" % (queue,))
+
+    if with_prev:
+        return dist, prev
     return dist
 
+def shortest_path(graph, start, target, banned_nodes=(), banned_edges=()):
+    """
+    Point-to-point Dijkstra that only touches the nodes it reaches
+    (no O(V) dist initialisation), the kernel of k_shortest_paths.py.
+    :param banned_nodes: nodes the path may not go through
+    :param banned_edges: (u, v) edges the path may not use
+    :return: (cost, path), or (inf, None) if target is unreachable
+    """
+    dist = {start: 0}
+    prev = {start: None}
+    heap = [(0, start)]
+    while heap:
+        current_dist, node = heapq.heappop(heap)
+        if current_dist > dist[node]:
+            continue  # stale entry
+        if node == target:
+            return current_dist, reconstruct_path(prev, target)
+        for neighbor, weight in graph[node]:
+            if neighbor in banned_nodes or (node, neighbor) in banned_edges:
+                continue
+            new_dist = current_dist + weight
+            if new_dist < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_dist
+                prev[neighbor] = node
+                heapq.heappush(heap, (new_dist, neighbor))
+    return float('inf'), None
+
+def reconstruct_path(prev, target):
+    if target not in prev:
+        return None  # unreachable
+    path = []
+    while target is not None:
+        path.append(target)
+        target = prev[target]
+    return path[::-1]
+
 graph_w = {
     'A': [('B', 1), ('C', 4)],
     'B': [('C', 2), ('D', 5)],
     'C': [('D', 1)],
     'D': []
 }
-print(dijkstra(graph_w, 'A'))  # {'A': 0, 'B': 1, 'C': 3, 'D': 4}
+
+if __name__ == "__main__":
+    print(dijkstra(graph_w, 'A'))  # {'A': 0, 'B': 1, 'C': 3, 'D': 4}
+
+    dist, prev = dijkstra(graph_w, 'A', target='C', with_prev=True)
+    print(dist['C'], reconstruct_path(prev, 'C'))  # 3 ['A', 'B', 'C']
+
+    print(shortest_path(graph_w, 'A', 'D', banned_edges={('C', 'D')}))  # (6, ['A', 'B', 'D'])
+
+
+# Lazy deletion:
+# heapq has no decrease-key, so an improved node is pushed again and the old
+# entry stays in the heap. Without the `current_dist > dist[node]` check every
+# stale entry re-scans the adjacency list of its node.
+# Early termination:
+# Nodes leave the heap in increasing distance order, so once the target is
+# popped its distance is final and the rest of the graph can be skipped.
+
+# queue='indexed' / 'radix' (indexed_heap.py):
+# handy_snippets/heapq.py only shows heapq usage (nlargest, nsmallest, top-k),
+# there is no heap implementation there to reuse; IndexedHeap is a separate
+# binary heap over typed arrays that adds decrease-key. It returns the keys as
+# pushed, so distances keep the graph's own type (ints stay ints) like heapq.
+# It is slower: heapq is written in C, IndexedHeap sifts in Python. Median of
+# 5 runs, random graph V = 50k, E = 400k, integer weights 1..100:
+#   heapq 0.64 s, indexed 1.11 s (radix ~0.66 s, see indexed_heap.py).
+# What it buys is memory (at most V heap entries instead of up to E) and
+# fewer heap operations on graphs where a node is improved many times.
+
+# Node expansions (adjacency scans), see dijkstra_expansions_benchmark.py,
+# random graph V = 20k, E = 160k, 20 queries:
+# before (no stale check, full tree):   35478 expansions / query
+# after (stale check, full tree):       19992 expansions / query
+# after (stale check, stop at target):   9176 expansions / query
 
 
 # The importance of using priority queue:
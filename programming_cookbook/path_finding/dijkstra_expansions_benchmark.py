@@ -0,0 +1,63 @@
+# Counts how many times each Dijkstra variant expands a node
+# (= scans its adjacency list) on the same random graph and queries.
+
+import heapq
+import random
+
+from dijkstra import dijkstra
+
+
+class CountingGraph(dict):
+    # dict-of-lists graph that counts adjacency lookups
+    expansions = 0
+
+    def __getitem__(self, node):
+        self.expansions += 1
+        return dict.__getitem__(self, node)
+
+
+def dijkstra_before(graph, start):
+    # original version: no stale-entry check, always the full tree
+    dist = {node: float('inf') for node in graph}
+    dist[start] = 0
+    heap = [(0, start)]
+    while heap:
+        current_dist, node = heapq.heappop(heap)
+        for neighbor, weight in graph[node]:
+            if current_dist + weight < dist[neighbor]:
+                dist[neighbor] = current_dist + weight
+                heapq.heappush(heap, (dist[neighbor], neighbor))
+    return dist
+
+
+def random_graph(n, degree, seed=0):
+    rnd = random.Random(seed)
+    return CountingGraph(
+        (u, [(rnd.randrange(n), rnd.randint(1, 100)) for _ in range(degree)])
+        for u in range(n))
+
+
+def run(n=20_000, degree=8, queries=20, seed=0):
+    graph = random_graph(n, degree, seed)
+    rnd = random.Random(seed + 1)
+    pairs = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(queries)]
+
+    variants = {
+        'before (no stale check, full tree)': lambda s, t: dijkstra_before(graph, s)[t],
+        'after (stale check, full tree)': lambda s, t: dijkstra(graph, s)[t],
+        'after (stale check, stop at target)': lambda s, t: dijkstra(graph, s, target=t)[t],
+    }
+    results = {}
+    for name, query in variants.items():
+        graph.expansions = 0
+        answers = [query(s, t) for s, t in pairs]
+        results[name] = (graph.expansions // queries, answers)
+
+    reference = results['before (no stale check, full tree)'][1]
+    for name, (expansions, answers) in results.items():
+        assert answers == reference, name
+        print(f"{name:<38} {expansions:>8} expansions / query")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,283 @@
+# Dynamic MST (insertions and weight decreases):
+# Rerunning kruskal() after every change costs O(E log E). But when an edge
+# (u, v, w) is added to a graph whose MST is T, the new MST is either T, or
+# T + (u, v) - (heaviest edge on the u..v path in T):
+#   - if u and v are in different trees, (u, v) joins them,
+#   - else (u, v) closes a cycle with the tree path; if w is smaller than the
+#     heaviest edge on that path, swap them (cycle property).
+# Decreasing the weight of a tree edge keeps T optimal; decreasing a non-tree
+# edge is the same as inserting it again with the new weight.
+
+# Link-cut tree (Sleator & Tarjan):
+# Keeps a forest of rooted trees and supports link, cut, make_root and
+# "max on the path u..v" in O(log n) amortised. Each tree is split into
+# preferred paths, every path is a splay tree keyed by depth that also keeps
+# the max of its subtree. Edges become extra nodes (u - e - v) carrying the
+# weight, so "max on path" finds the edge to swap out.
+
+from spanning_tree import kruskal
+
+
+class LinkCutTree:
+    def __init__(self):
+        # parallel lists, -1 = no node
+        self.left, self.right, self.parent = [], [], []
+        self.flip = []      # lazy "reverse this subtree" flag
+        self.val = []       # weight of an edge node, -inf for a vertex node
+        self.top = []       # node with the max val in the splay subtree
+
+    def add_node(self, val):
+        x = len(self.val)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.val.append(val)
+        self.top.append(x)
+        return x
+
+    def _is_root(self, x):
+        # root of its splay tree (parent is a path-parent pointer or none)
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            self.left[x], self.right[x] = self.right[x], self.left[x]
+            for c in (self.left[x], self.right[x]):
+                if c != -1:
+                    self.flip[c] = not self.flip[c]
+            self.flip[x] = False
+
+    def _pull(self, x):
+        best = x
+        for c in (self.left[x], self.right[x]):
+            if c != -1 and self.val[self.top[c]] > self.val[best]:
+                best = self.top[c]
+        self.top[x] = best
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] != -1:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] != -1:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # push pending flips from the splay root down to x first
+        path = [x]
+        while not self._is_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                zig_zig = (self.left[g] == p) == (self.left[p] == x)
+                self._rotate(p if zig_zig else x)
+            self._rotate(x)
+
+    def _access(self, x):
+        # make root..x the preferred path, x ends up at the root of its splay tree
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        # x and y must be adjacent
+        self.make_root(x)
+        self._access(y)
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def path_max(self, x, y):
+        # node with the largest val on the path x..y
+        self.make_root(x)
+        self._access(y)
+        return self.top[y]
+
+    def set_val(self, x, val):
+        self._access(x)
+        self.val[x] = val
+        self._pull(x)
+
+
+class DynamicMST:
+    def __init__(self, vertices, mst_edges=()):
+        """
+        :param vertices: list of nodes, like kruskal()
+        :param mst_edges: (u, v, weight) edges of an MST, e.g. kruskal(...)[0]
+        """
+        self.lct = LinkCutTree()
+        self.ids = {}
+        for vertex in vertices:
+            self.ids[vertex] = self.lct.add_node(float('-inf'))
+        self.edge_node = {}   # (u, v) -> edge node in the link-cut tree
+        self.endpoints = {}   # edge node -> (u, v)
+        self.free = []        # edge nodes of removed edges, reused
+        self.total_weight = 0
+        for u, v, weight in mst_edges:
+            self._link(u, v, weight)
+
+    @classmethod
+    def from_kruskal(cls, vertices, edges):
+        mst, _ = kruskal(vertices, list(edges))
+        return cls(vertices, mst)
+
+    def _key(self, u, v):
+        return (u, v) if self.ids[u] <= self.ids[v] else (v, u)
+
+    def _link(self, u, v, weight):
+        if self.free:
+            e = self.free.pop()
+            self.lct.set_val(e, weight)
+        else:
+            e = self.lct.add_node(weight)
+        self.lct.link(self.ids[u], e)
+        self.lct.link(e, self.ids[v])
+        self.edge_node[self._key(u, v)] = e
+        self.endpoints[e] = (u, v)
+        self.total_weight += weight
+
+    def _cut(self, e):
+        u, v = self.endpoints.pop(e)
+        del self.edge_node[self._key(u, v)]
+        self.lct.cut(self.ids[u], e)
+        self.lct.cut(e, self.ids[v])
+        self.total_weight -= self.lct.val[e]
+        self.free.append(e)
+
+    def insert_edge(self, u, v, weight):
+        """
+        :return: True if the MST changed
+        """
+        x, y = self.ids[u], self.ids[v]
+        if x == y:
+            return False
+        if not self.lct.connected(x, y):
+            self._link(u, v, weight)
+            return True
+        heaviest = self.lct.path_max(x, y)
+        if weight >= self.lct.val[heaviest]:
+            return False  # (u, v) would be the heaviest edge on its cycle
+        self._cut(heaviest)
+        self._link(u, v, weight)
+        return True
+
+    def decrease_weight(self, u, v, weight):
+        """
+        :return: True if the MST changed
+        :raises ValueError: if (u, v) is a tree edge and weight is higher than its
+                            current weight (an increase would need a search for a
+                            replacement edge among the non-tree edges, which are
+                            not stored)
+        """
+        e = self.edge_node.get(self._key(u, v))
+        if e is None:
+            # non-tree edge: it can only enter the tree
+            return self.insert_edge(u, v, weight)
+        if weight > self.lct.val[e]:
+            raise ValueError("decrease_weight(%r, %r): %r is higher than the current weight %r"
+                             % (u, v, weight, self.lct.val[e]))
+        self.total_weight += weight - self.lct.val[e]
+        self.lct.set_val(e, weight)
+        return False  # a lighter tree edge keeps the tree optimal
+
+    def edges(self):
+        return [(u, v, self.lct.val[e]) for e, (u, v) in self.endpoints.items()]
+
+
+if __name__ == "__main__":
+    import random
+
+    vertices = ['A', 'B', 'C', 'D']
+    edges = [
+        (1, 'A', 'B'),
+        (3, 'A', 'C'),
+        (2, 'B', 'C'),
+        (4, 'C', 'D')
+    ]
+    dynamic = DynamicMST.from_kruskal(vertices, edges)
+    print(dynamic.total_weight)            # 7
+    dynamic.insert_edge('A', 'D', 2)       # replaces C-D (4)
+    print(sorted(dynamic.edges()), dynamic.total_weight)
+    # [('A', 'B', 1), ('A', 'D', 2), ('B', 'C', 2)] 5
+    dynamic.decrease_weight('B', 'C', 1)   # tree edge gets lighter
+    print(dynamic.total_weight)            # 4
+    try:
+        dynamic.decrease_weight('B', 'C', 3)  # an increase would break the invariant
+    except ValueError as error:
+        print(error)  # decrease_weight('B', 'C'): 3 is higher than the current weight 1
+
+    # random updates checked against a fresh kruskal() run
+    random.seed(0)
+    n = 200
+    vertices = list(range(n))
+    edges = [(random.randint(1, 1000), random.randrange(n), random.randrange(n)) for _ in range(600)]
+    dynamic = DynamicMST.from_kruskal(vertices, edges)
+    weights = {}
+    for weight, u, v in edges:
+        key = (min(u, v), max(u, v))
+        weights[key] = min(weight, weights.get(key, weight))
+    for _ in range(2000):
+        u, v = random.randrange(n), random.randrange(n)
+        key = (min(u, v), max(u, v))
+        weight = random.randint(1, weights.get(key, 1000))
+        if key in weights:
+            dynamic.decrease_weight(u, v, weight)
+        else:
+            dynamic.insert_edge(u, v, weight)
+        weights[key] = weight
+    _, expected = kruskal(vertices, [(w, u, v) for (u, v), w in weights.items()])
+    print(dynamic.total_weight == expected)  # True
+
+
+# insert_edge / decrease_weight: O(log n) amortised (a constant number of
+# link-cut operations), total_weight: O(1), kept up to date on every change.
+# Space: O(V + tree edges), non-tree edges are not stored.
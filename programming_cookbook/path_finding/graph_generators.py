@@ -0,0 +1,116 @@
+# Synthetic graphs for benchmarks:
+# Every generator returns (CSRGraph, coords): an undirected graph with each edge
+# stored in both directions (so bfs/dijkstra and the MST algorithms see the
+# same graph), and coords = (V, 2) node positions, or None when the graph has
+# no geometry. All of them are vectorized with NumPy, a graph with 10^7 edges
+# takes a few seconds.
+
+#   random_graph:    m edges between uniformly random endpoints (Erdős–Rényi G(n, m)).
+#   grid_graph:      rows x cols 4-neighbor lattice, weights >= 1 (the Euclidean
+#                    distance between neighbors), like an occupancy grid.
+#   power_law_graph: Chung-Lu model, node i is picked as an endpoint with
+#                    probability ~ (i + 1)^(-1 / (exponent - 1)), so degrees follow
+#                    a power law: a few hubs, many leaves (web, social graphs).
+#   road_graph:      jittered lattice with some diagonals and missing streets,
+#                    weight = length * (1 + detour), sparse, near-planar and
+#                    with coordinates, so A* with the Euclidean heuristic applies.
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+KINDS = ('random', 'grid', 'power_law', 'road')
+
+
+def undirected_csr(n, u, v, w):
+    """
+    CSR graph with every edge (u, v, w) stored as u -> v and v -> u; self-loops are dropped.
+    """
+    keep = u != v
+    u, v, w = u[keep], v[keep], w[keep]
+    sources = np.concatenate((u, v))
+    targets = np.concatenate((v, u))
+    weights = np.concatenate((w, w))
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+    id_type = np.int32 if n < 2**31 else np.int64
+    return CSRGraph(offsets, targets[order].astype(id_type), weights[order])
+
+
+def random_graph(n, m, seed=0):
+    rng = np.random.default_rng(seed)
+    u, v = rng.integers(0, n, m), rng.integers(0, n, m)
+    return undirected_csr(n, u, v, rng.integers(1, 100, m).astype(np.float64)), None
+
+
+def grid_graph(rows, cols, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    w = 1 + rng.random(len(u)) * 4  # terrain cost, never below the straight-line distance
+    r, c = np.divmod(np.arange(rows * cols), cols)
+    return undirected_csr(rows * cols, u, v, w), np.column_stack((c, r)).astype(np.float64)
+
+
+def power_law_graph(n, m, exponent=2.5, seed=0):
+    rng = np.random.default_rng(seed)
+    p = (np.arange(n) + 1.0) ** (-1 / (exponent - 1))
+    cdf = np.cumsum(p)
+    cdf /= cdf[-1]
+    # inverse-CDF sampling; the node order is shuffled so hubs are not ids 0, 1, 2, ...
+    relabel = rng.permutation(n)
+    u = relabel[np.searchsorted(cdf, rng.random(m), side='right').clip(max=n - 1)]
+    v = relabel[np.searchsorted(cdf, rng.random(m), side='right').clip(max=n - 1)]
+    return undirected_csr(n, u, v, rng.integers(1, 100, m).astype(np.float64)), None
+
+
+def road_graph(rows, cols, seed=0):
+    rng = np.random.default_rng(seed)
+    n = rows * cols
+    ids = np.arange(n).reshape(rows, cols)
+    r, c = np.divmod(np.arange(n), cols)
+    coords = np.column_stack((c + rng.random(n) * 0.6, r + rng.random(n) * 0.6))
+
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel(), ids[:-1, :-1].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel(), ids[1:, 1:].ravel()))
+    straight = (rows * (cols - 1) + (rows - 1) * cols)
+    # 85% of the streets exist, 15% of the blocks have a diagonal
+    keep = rng.random(len(u)) < np.where(np.arange(len(u)) < straight, 0.85, 0.15)
+    u, v = u[keep], v[keep]
+    length = np.hypot(*(coords[u] - coords[v]).T)
+    w = length * (1 + rng.random(len(u)) * 0.3)
+    return undirected_csr(n, u, v, w), coords
+
+
+def generate(kind, m, seed=0):
+    """
+    Graph of the given kind with about m undirected edges.
+    """
+    if kind == 'random':
+        return random_graph(max(m // 4, 2), m, seed)
+    if kind == 'grid':
+        side = max(int((m / 2) ** 0.5), 2)
+        return grid_graph(side, side, seed)
+    if kind == 'power_law':
+        return power_law_graph(max(m // 4, 2), m, seed=seed)
+    if kind == 'road':
+        side = max(int((m / 1.85) ** 0.5), 2)  # ~1.85 edges per node after dropping streets
+        return road_graph(side, side, seed)
+    raise ValueError("unknown graph kind %r, expected one of %s" % (kind, KINDS))
+
+
+if __name__ == "__main__":
+    import time
+
+    for kind in KINDS:
+        t0 = time.perf_counter()
+        g, coords = generate(kind, 1_000_000)
+        degrees = np.diff(g.offsets)
+        print(f"{kind:<10} V={g.num_nodes:>8} E={g.num_edges // 2:>8} max degree {degrees.max():>5}"
+              f" {time.perf_counter() - t0:.2f} s")
+    # random     V=  250000 E=  999998 max degree    24 0.55 s
+    # grid       V=  499849 E=  998284 max degree     4 0.11 s
+    # power_law  V=  250000 E=  999888 max degree 10539 0.97 s
+    # road       V=  540225 E=  998060 max degree     6 0.20 s
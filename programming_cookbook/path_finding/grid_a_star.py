@@ -0,0 +1,322 @@
+# A* directly on a 2-D occupancy grid:
+# a_star() needs a dict graph, for a grid that means one dict entry and one
+# list of (neighbor, weight) tuples per cell, built before the search starts.
+# Here the grid itself is the graph: cells are flat indices r * W + c into a
+# copy of the grid padded with a border of walls, so neighbors are index
+# offsets (+-1, +-W, +-W +-1) and no bounds checks are needed.
+
+# Moves: 4-connected (cost 1, Manhattan heuristic) or 8-connected (diagonal cost
+# sqrt(2), octile heuristic max(dr, dc) + (sqrt(2) - 1) * min(dr, dc)). A
+# diagonal move is only allowed when both orthogonal cells next to it are free
+# (no cutting corners of walls).
+
+# Jump point search (Harabor & Grastien, 2011), 8-connected only:
+# On open areas A* expands every cell of a wide band, because many paths of the
+# same cost lead through them. JPS only adds "jump points" to the open list:
+#   - a straight jump runs along a row/column until the goal, a wall, or a cell
+#     with a forced neighbor (a cell that is only reachable optimally through
+#     the current one, because a wall stands next to the way we came);
+#   - a diagonal jump stops where a straight jump in one of its two components
+#     would find something.
+# The cells skipped in between are never pushed, and the path between two jump
+# points is a straight or diagonal line, filled back in at the end.
+# The pruning rules are the ones for "diagonal moves only if no obstacle"
+# movement, so the result is optimal for the same moves as grid_a_star(diagonal=True).
+
+import heapq
+import math
+
+import numpy as np
+
+SQRT2 = math.sqrt(2)
+
+
+def _pad(grid):
+    # free[i] for the flat index of the padded grid, border cells are walls
+    walls = np.pad(np.asarray(grid, dtype=bool), 1, constant_values=True)
+    return (~walls).ravel().tolist(), walls.shape[1]
+
+
+def _heuristic(diagonal, width, goal):
+    goal_r, goal_c = divmod(goal, width)
+
+    if diagonal:
+        def h(node):
+            dr, dc = divmod(node, width)
+            dr, dc = abs(dr - goal_r), abs(dc - goal_c)
+            return dr + dc + (SQRT2 - 2) * min(dr, dc)  # octile
+    else:
+        def h(node):
+            dr, dc = divmod(node, width)
+            return abs(dr - goal_r) + abs(dc - goal_c)  # Manhattan
+    return h
+
+
+def _cells(path, width):
+    return [(node // width - 1, node % width - 1) for node in path]
+
+
+def _check(free, width, start, goal):
+    # (start, goal) as plain int tuples, e.g. for cells taken from np.argwhere
+    rows, cols = len(free) // width - 2, width - 2
+    cells = []
+    for cell in (start, goal):
+        r, c = int(cell[0]), int(cell[1])
+        # bounds first: the flat index of an off-grid cell wraps into another row
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError("cell %r is outside the grid" % (cell,))
+        if not free[(r + 1) * width + c + 1]:
+            raise ValueError("cell %r is blocked" % (cell,))
+        cells.append((r, c))
+    return cells
+
+
+def grid_a_star(grid, start, goal, diagonal=True, stats=None):
+    """
+    :param grid: 2-D boolean NumPy array, True = blocked
+    :param start, goal: (row, col)
+    :param diagonal: 8-connected moves (octile) if True, else 4-connected (Manhattan)
+    :param stats: optional dict, gets the number of 'expanded' cells
+    :return: (path as a list of (row, col), cost), or (None, inf)
+    """
+    free, width = _pad(grid)
+    start, goal = _check(free, width, start, goal)
+    source = (start[0] + 1) * width + start[1] + 1
+    target = (goal[0] + 1) * width + goal[1] + 1
+    h = _heuristic(diagonal, width, target)
+
+    moves = [(1, 1.0), (-1, 1.0), (width, 1.0), (-width, 1.0)]
+    if diagonal:
+        moves += [(width + 1, SQRT2), (width - 1, SQRT2), (-width + 1, SQRT2), (-width - 1, SQRT2)]
+
+    g_score = {source: 0.0}
+    came_from = {source: -1}
+    open_set = [(h(source), 0.0, source)]
+    expanded = 0
+    while open_set:
+        _, current_g, current = heapq.heappop(open_set)
+        if current_g > g_score[current]:
+            continue  # stale entry
+        expanded += 1
+        if current == target:
+            break
+        for step, cost in moves:
+            neighbor = current + step
+            if not free[neighbor]:
+                continue
+            if cost != 1.0:
+                # diagonal: both cells it passes between must be free
+                vertical = width if step > 0 else -width
+                if not (free[current + vertical] and free[current + step - vertical]):
+                    continue
+            tentative_g = current_g + cost
+            if tentative_g < g_score.get(neighbor, math.inf):
+                g_score[neighbor] = tentative_g
+                came_from[neighbor] = current
+                heapq.heappush(open_set, (tentative_g + h(neighbor), tentative_g, neighbor))
+    if stats is not None:
+        stats['expanded'] = expanded
+    if target not in g_score:
+        return None, math.inf
+
+    path = [target]
+    while came_from[path[-1]] != -1:
+        path.append(came_from[path[-1]])
+    return _cells(path[::-1], width), g_score[target]
+
+
+def jump_point_search(grid, start, goal, stats=None):
+    """
+    8-connected A* with jump point pruning, same arguments and result as grid_a_star().
+    """
+    free, width = _pad(grid)
+    start, goal = _check(free, width, start, goal)
+    source = (start[0] + 1) * width + start[1] + 1
+    target = (goal[0] + 1) * width + goal[1] + 1
+    h = _heuristic(True, width, target)
+
+    def straight(node, step, side):
+        # walk along step (±1 or ±width), side is the perpendicular offset
+        while free[node]:
+            if node == target:
+                return node
+            # forced neighbor: a free side cell whose way back along step is blocked
+            if ((free[node - side] and not free[node - side - step]) or
+                    (free[node + side] and not free[node + side - step])):
+                return node
+            node += step
+        return -1
+
+    def jump(node, dr, dc):
+        # jump point reached from node - (dr, dc), or -1
+        if dr and dc:
+            row_step, col_step = dr * width, dc
+            while free[node]:
+                if node == target:
+                    return node
+                if (straight(node + col_step, col_step, width) != -1 or
+                        straight(node + row_step, row_step, 1) != -1):
+                    return node
+                if not (free[node + col_step] and free[node + row_step]):
+                    return -1  # the next diagonal move would cut a corner
+                node += row_step + col_step
+            return -1
+        if dc:
+            return straight(node, dc, width)
+        return straight(node, dr * width, 1)
+
+    def directions(node, parent):
+        # (dr, dc) of the neighbors that are not pruned
+        if parent == -1:
+            result = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+            result += [(dr, dc) for dr in (1, -1) for dc in (1, -1)
+                       if free[node + dr * width] and free[node + dc]]
+            return result
+        (r, c), (pr, pc) = divmod(node, width), divmod(parent, width)
+        dr, dc = (r > pr) - (r < pr), (c > pc) - (c < pc)
+        result = []
+        if dr and dc:
+            down, right = free[node + dr * width], free[node + dc]
+            if down:
+                result.append((dr, 0))
+            if right:
+                result.append((0, dc))
+            if down and right:
+                result.append((dr, dc))
+        elif dc:
+            ahead, up, down = free[node + dc], free[node - width], free[node + width]
+            if ahead:
+                result.append((0, dc))
+                if up:
+                    result.append((-1, dc))
+                if down:
+                    result.append((1, dc))
+            if up:
+                result.append((-1, 0))
+            if down:
+                result.append((1, 0))
+        else:
+            ahead, left, right = free[node + dr * width], free[node - 1], free[node + 1]
+            if ahead:
+                result.append((dr, 0))
+                if left:
+                    result.append((dr, -1))
+                if right:
+                    result.append((dr, 1))
+            if left:
+                result.append((0, -1))
+            if right:
+                result.append((0, 1))
+        return result
+
+    g_score = {source: 0.0}
+    came_from = {source: -1}
+    open_set = [(h(source), 0.0, source)]
+    expanded = 0
+    while open_set:
+        _, current_g, current = heapq.heappop(open_set)
+        if current_g > g_score[current]:
+            continue  # stale entry
+        expanded += 1
+        if current == target:
+            break
+        r, c = divmod(current, width)
+        for dr, dc in directions(current, came_from[current]):
+            point = jump(current + dr * width + dc, dr, dc)
+            if point == -1:
+                continue
+            pr, pc = divmod(point, width)
+            # the way to a jump point is a straight or diagonal line: octile distance
+            d_r, d_c = abs(pr - r), abs(pc - c)
+            tentative_g = current_g + d_r + d_c + (SQRT2 - 2) * min(d_r, d_c)
+            if tentative_g < g_score.get(point, math.inf):
+                g_score[point] = tentative_g
+                came_from[point] = current
+                heapq.heappush(open_set, (tentative_g + h(point), tentative_g, point))
+    if stats is not None:
+        stats['expanded'] = expanded
+    if target not in g_score:
+        return None, math.inf
+
+    # jump points -> every cell on the lines between them
+    points = [target]
+    while came_from[points[-1]] != -1:
+        points.append(came_from[points[-1]])
+    points.reverse()
+    path = [points[0]]
+    for a, b in zip(points, points[1:]):
+        (ar, ac), (br, bc) = divmod(a, width), divmod(b, width)
+        step = ((br > ar) - (br < ar)) * width + (bc > ac) - (bc < ac)
+        node = a
+        while node != b:
+            node += step
+            path.append(node)
+    return _cells(path, width), g_score[target]
+
+
+if __name__ == "__main__":
+    import time
+
+    grid = np.array([
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 1, 0],
+        [1, 1, 0, 1, 0],
+        [0, 0, 0, 0, 0],
+    ], dtype=bool)
+    print(grid_a_star(grid, (2, 0), (2, 4), diagonal=False))
+    # ([(2, 0), (1, 0), (0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 4), (2, 4)], 8.0)
+    print(jump_point_search(grid, (2, 0), (2, 4))[1])  # 8.0, the diagonals would cut corners
+
+    # off-grid cells raise instead of wrapping into a neighbouring row
+    for search in (grid_a_star, jump_point_search):
+        for cell in ((0, 6), (0, 5), (-1, 0), (5, 0)):
+            try:
+                search(grid, (0, 0), cell)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(cell)
+    # NumPy integer coordinates, as returned by np.argwhere
+    start, goal = np.argwhere(~grid)[[0, -1]]
+    assert grid_a_star(grid, start, goal) == jump_point_search(grid, start, goal)
+
+    # random grids, JPS must match plain 8-connected A*
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        grid = rng.random((20, 30)) < 0.3
+        start, goal = (0, 0), (19, 29)
+        grid[start] = grid[goal] = False
+        _, expected = grid_a_star(grid, start, goal)
+        path, cost = jump_point_search(grid, start, goal)
+        assert math.isclose(cost, expected), (cost, expected)
+        if path:
+            steps = [(abs(a - c), abs(b - d)) for (a, b), (c, d) in zip(path, path[1:])]
+            assert all(max(step) == 1 for step in steps)
+            assert math.isclose(sum(SQRT2 if dr and dc else 1 for dr, dc in steps), cost)
+    print("jps == a_star on 300 random grids")
+
+    # open 1000 x 1000 map with a few long walls
+    size = 1000
+    grid = np.zeros((size, size), dtype=bool)
+    for i in range(1, 10):
+        row = i * size // 10
+        gap = rng.integers(0, size)
+        grid[row, :] = True
+        grid[row, gap:gap + 5] = False
+    for name, search in (('grid_a_star', grid_a_star), ('jump_point_search', jump_point_search)):
+        stats = {}
+        t0 = time.perf_counter()
+        _, cost = search(grid, (0, 0), (size - 1, size - 1), stats=stats)
+        print(f"{name:<18} cost {cost:.1f}, {stats['expanded']:>7} expanded, "
+              f"{time.perf_counter() - t0:.2f} s")
+
+
+# grid_a_star: O(N log N) for N = rows * cols cells, no graph is built.
+# jump_point_search: same worst case, but on open maps the open list only sees
+# jump points; scanning a cell during a jump costs a few list lookups instead
+# of a heap push and pop.
+
+# Demo above (1000 x 1000, 9 walls with one gap each):
+# grid_a_star        760935 expanded, 6.8 s
+# jump_point_search      35 expanded, 0.4 s
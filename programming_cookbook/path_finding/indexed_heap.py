@@ -0,0 +1,173 @@
+# Priority queues for graph searches (see also handy_snippets/heapq.py).
+
+# heapq has no decrease-key: Dijkstra pushes a node again every time its distance
+# improves and skips the stale copies later, so the heap can grow to O(E) entries.
+
+# Indexed binary heap:
+# Items are integer ids 0..n-1. Besides the heap array we keep pos[item], the
+# index of the item in the heap (-1 if absent). decrease_key(item) finds the item
+# in O(1) and sifts it up in O(log n); the heap never holds more than n entries.
+# heap and pos are typed arrays (array module), so there is no per-entry tuple.
+# keys is a plain list: keys come back exactly as pushed (int distances stay
+# ints, as with heapq, and ints above 2^53 are not rounded to float).
+
+# Radix heap (monotone integer keys):
+# Dijkstra with integer weights only ever pops keys >= the last popped key.
+# Bucket i holds keys whose highest bit differing from `last` is bit i-1
+# (bucket 0: key == last). Pop empties bucket 0, or redistributes the first
+# non-empty bucket around its minimum; every key moves to a lower bucket each
+# time, so at most log2(C) moves per key (C = max edge weight).
+
+from array import array
+
+
+class IndexedHeap:
+    __slots__ = ('heap', 'keys', 'pos')
+
+    def __init__(self, capacity):
+        self.heap = array('q')                          # heap of item ids
+        self.keys = [0] * capacity                      # keys[item], any comparable
+        self.pos = array('q', [-1]) * capacity          # index of item in heap, -1 if absent
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.pos[item] != -1
+
+    def push(self, item, key):
+        self.keys[item] = key
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, key):
+        self.keys[item] = key
+        self._sift_up(self.pos[item])
+
+    def push_or_decrease(self, item, key):
+        # returns False if item is already queued with a key <= key
+        if self.pos[item] == -1:
+            self.push(item, key)
+        elif key < self.keys[item]:
+            self.decrease_key(item, key)
+        else:
+            return False
+        return True
+
+    def pop(self):
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, i):
+        # move the hole up instead of swapping on every level
+        heap, keys, pos = self.heap, self.keys, self.pos
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            heap[i] = parent_item
+            pos[parent_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, keys, pos = self.heap, self.keys, self.pos
+        n = len(heap)
+        item = heap[i]
+        key = keys[item]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            child_item = heap[child]
+            if key <= keys[child_item]:
+                break
+            heap[i] = child_item
+            pos[child_item] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+
+class RadixHeap:
+    __slots__ = ('buckets', 'last', 'size')
+
+    def __init__(self, max_bits=64):
+        self.buckets = [[] for _ in range(max_bits + 1)]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, item):
+        # key must be an int >= the last popped key
+        self.buckets[(key ^ self.last).bit_length()].append((key, item))
+        self.size += 1
+
+    def pop(self):
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            bucket = buckets[i]
+            buckets[i] = []
+            self.last = last = min(bucket)[0]
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.size -= 1
+        return buckets[0].pop()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from dijkstra import dijkstra
+    from A_star import a_star, heuristic
+
+    heap = IndexedHeap(5)
+    for item, key in enumerate([5.0, 3.0, 8.0, 1.0, 9.0]):
+        heap.push(item, key)
+    heap.decrease_key(4, 0.5)
+    print([heap.pop() for _ in range(len(heap))])
+    # [(0.5, 4), (1.0, 3), (3.0, 1), (5.0, 0), (8.0, 2)]
+
+    radix = RadixHeap()
+    for key in [7, 3, 10, 3, 42]:
+        radix.push(key, 'node%d' % key)
+    print([radix.pop() for _ in range(len(radix))])
+    # [(3, 'node3'), (3, 'node3'), (7, 'node7'), (10, 'node10'), (42, 'node42')]
+
+    random.seed(0)
+    n = 50_000
+    graph = {u: [(random.randrange(n), random.randint(1, 100)) for _ in range(8)]
+             for u in range(n)}
+    for queue in (None, 'indexed', 'radix'):
+        t0 = time.perf_counter()
+        dist = dijkstra(graph, 0, queue=queue)
+        reached = [d for d in dist.values() if d < float('inf')]
+        print(f"queue={queue}: {time.perf_counter() - t0:.2f} s, "
+              f"{len(reached)} reached, total distance {sum(reached)}")
+    print(a_star(graph, 0, 1, heuristic) == a_star(graph, 0, 1, heuristic, queue='indexed'))
+
+
+# IndexedHeap: push / pop / decrease_key O(log n), at most n entries, O(n) space.
+# RadixHeap: push O(1), pop amortised O(log C), only for monotone integer keys.
+# Demo above (V = 50k, E = 400k, weights 1..100): heapq ~0.5 s, indexed ~0.9 s,
+# radix ~0.37 s.
+# In CPython heapq (written in C) often still wins on raw speed; the indexed
+# heap wins on memory (V instead of E entries) and on graphs with many
+# improvements per node (dense graphs).
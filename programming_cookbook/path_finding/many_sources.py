@@ -0,0 +1,121 @@
+# Many-sources shortest paths:
+# Running dijkstra(graph, s) for hundreds of sources is embarrassingly parallel,
+# every source is an independent search over the same read-only graph.
+# Threads don't help (the GIL serialises the Python relaxation loop), so the
+# work goes to a ProcessPoolExecutor.
+
+# The naive way pickles the whole graph into every task. Instead the CSR arrays
+# are copied once into shared memory (multiprocessing.shared_memory); each worker
+# attaches to the same pages in its initializer and wraps them in NumPy arrays
+# without copying. A task is then just a small batch of source ids, and the
+# answer is one compact float64 distance row per source.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from csr_graph import CSRGraph, dijkstra_csr
+
+
+def _share(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+_worker = {}
+
+
+def _attach(specs):
+    # worker initializer: map the shared CSR arrays, no copy
+    arrays = []
+    for name, shape, dtype in specs:
+        shm = shared_memory.SharedMemory(name=name)
+        _worker.setdefault('handles', []).append(shm)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    _worker['graph'] = CSRGraph(*arrays)
+
+
+def _rows(sources):
+    g = _worker['graph']
+    return sources, np.vstack([dijkstra_csr(g, s) for s in sources])
+
+
+def many_source_dijkstra(g, sources, workers=None, batch_size=8):
+    """
+    Distance rows for many sources, computed in parallel.
+    :param g: CSRGraph
+    :param sources: node labels
+    :param workers: number of processes (default: os.cpu_count())
+    :param batch_size: sources per task, amortises the task round trip
+    :return: generator of (source, dist row) in completion order,
+             dist row[i] = distance to node id i
+    """
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        for source in sources:
+            yield source, dijkstra_csr(g, source)
+        return
+    ids = [g.node_id(s) for s in sources]
+
+    handles, specs = zip(*(_share(a) for a in (g.offsets, g.targets, g.weights)))
+    try:
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(specs,)) as pool:
+            batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+            futures = [pool.submit(_rows, batch) for batch in batches]
+            for future in as_completed(futures):
+                batch, rows = future.result()
+                for i, row in zip(batch, rows):
+                    yield g.label(i), row
+    finally:
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+
+def all_sources_dijkstra(g, workers=None):
+    """
+    :return: V x V float64 matrix, row i = distances from node id i
+    """
+    matrix = np.empty((g.num_nodes, g.num_nodes))
+    for source, row in many_source_dijkstra(g, list(map(g.label, range(g.num_nodes))), workers):
+        matrix[g.node_id(source)] = row
+    return matrix
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    graph_w = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('C', 2), ('D', 5)],
+        'C': [('D', 1)],
+        'D': []
+    }
+    print(all_sources_dijkstra(CSRGraph.from_dict(graph_w), workers=2))
+    # [[ 0.  1.  3.  4.]
+    #  [inf  0.  2.  3.]
+    #  [inf inf  0.  1.]
+    #  [inf inf inf  0.]]
+
+    random.seed(0)
+    n = 20_000
+    g = CSRGraph.from_dict({u: [(random.randrange(n), random.random()) for _ in range(6)]
+                            for u in range(n)})
+    sources = list(range(32))
+    for workers in (1, 2, 4, 8):
+        t0 = time.perf_counter()
+        for _ in many_source_dijkstra(g, sources, workers):
+            pass
+        print(f"{workers} workers: {time.perf_counter() - t0:.2f} s")
+
+
+# Time: O(S (V + E) log V / P) for S sources on P cores, plus one O(V + E) copy
+# into shared memory. The graph is stored once no matter how many workers.
+# Rows are yielded as soon as a batch finishes, so the caller can write them
+# out instead of holding the whole S x V matrix.
+# With P cores the speedup is close to P once each worker gets several batches;
+# on a single core the extra processes only add overhead.
@@ -0,0 +1,196 @@
+# Borůvka's MST algorithm:
+# Each round, every component picks its cheapest outgoing edge, and all of those
+# edges are added at once (they are all in the MST when ties are broken
+# consistently). Each round at least halves the number of components, so there
+# are at most log2(V) rounds.
+
+# Unlike Kruskal, nothing is sequential inside a round:
+#   - "cheapest outgoing edge per component" is a segment-min over the edge
+#     arrays, keyed by the component id of each endpoint (np.minimum.at),
+#   - the edge arrays are split into P fixed slices, one task per slice; each
+#     task writes the segment-min of its slice into its own row of a P x V
+#     array and the rows are combined with one np.minimum,
+#   - contraction = union_many() of the chosen edges on the array-backed
+#     union-find (union_find.UnionFind).
+
+# Shrinking edge list: an edge whose ends are in the same component can never
+# be chosen again. Each task first rewrites its slice in place: endpoints are
+# replaced by their component ids, internal edges are dropped and the rest is
+# packed to the front of the slice. The task returns the new slice length, so
+# later rounds only scan the edges that still cross components.
+
+# Workers (as in many_sources.py): u, v, rank, the component labels and the
+# P x V output rows live in shared memory (multiprocessing.shared_memory),
+# mapped once per worker by the pool initializer. A task is (row, start,
+# count), three ints; the parent writes the component labels of the round into
+# the shared array and reads the rows back, nothing of size V or E is pickled.
+
+# Tie-breaking: edges are ranked once by (weight, index) with argsort, and the
+# rank is compared instead of the weight, so no two edges are equal and the
+# chosen edges can never form a cycle.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from union_find import UnionFind
+
+
+def _share(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+_worker = {}
+
+
+def _attach(specs):
+    # worker initializer: map the shared arrays, no copy
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker.setdefault('handles', []).append(shm)
+        _worker[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _cheapest(task):
+    # worker side: the arrays were mapped once by _attach
+    return _segment_min(_worker, *task)
+
+
+def _segment_min(arrays, row, start, count):
+    """
+    One slice of one round: drop the edges that became internal, pack the rest
+    to the front of the slice (endpoints as component ids), and write
+    best[c] = min rank leaving component c into arrays['best'][row].
+    :return: number of edges left in the slice
+    """
+    u, v, rank, component = arrays['u'], arrays['v'], arrays['rank'], arrays['component']
+    end = start + count
+    cu, cv = component[u[start:end]], component[v[start:end]]
+    outgoing = cu != cv
+    cu, cv, r = cu[outgoing], cv[outgoing], rank[start:end][outgoing]
+    count = len(r)
+    u[start:start + count], v[start:start + count], rank[start:start + count] = cu, cv, r
+    best = arrays['best'][row]
+    best.fill(len(rank))
+    np.minimum.at(best, cu, r)
+    np.minimum.at(best, cv, r)
+    return count
+
+
+def boruvka(n, u, v, w, workers=1):
+    """
+    :param n: number of nodes (ids 0..n-1)
+    :param u, v, w: edge endpoints and weights (undirected)
+    :param workers: processes for the per-round segment-min (1 = in process)
+    :return: (mst_u, mst_v, mst_w) arrays, total weight
+             (a minimum spanning forest if the graph is disconnected)
+    """
+    u, v, w = np.asarray(u, dtype=np.int64), np.asarray(v, dtype=np.int64), np.asarray(w)
+    m = len(w)
+    order = np.argsort(w, kind='stable')
+    rank = np.empty(m, dtype=np.int64)
+    rank[order] = np.arange(m)
+
+    tasks = max(workers, 1)
+    slices = np.linspace(0, m, tasks + 1).astype(np.int64).tolist()
+    starts, counts = slices[:-1], np.diff(slices).tolist()
+    # working copies: the tasks rewrite u, v and rank in place
+    arrays = {'u': u.copy(), 'v': v.copy(), 'rank': rank,
+              'component': np.empty(n, dtype=np.int64),
+              'best': np.empty((tasks, n), dtype=np.int64)}
+    handles = []
+    pool = None
+    if workers > 1:
+        specs = {}
+        for key, array in arrays.items():
+            shm, specs[key] = _share(array)
+            handles.append(shm)
+            arrays[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        pool = ProcessPoolExecutor(workers, initializer=_attach, initargs=(specs,))
+
+    ds = UnionFind(n)
+    chosen = []
+    try:
+        while sum(counts):
+            arrays['component'][:] = ds.find_many(np.arange(n))
+            round_tasks = [(row, starts[row], counts[row]) for row in range(tasks)]
+            if pool:
+                counts = list(pool.map(_cheapest, round_tasks))
+            else:
+                # in process: pass the arrays, no module global outlives the call
+                counts = [_segment_min(arrays, *task) for task in round_tasks]
+            best = arrays['best'].min(axis=0)
+            best = np.unique(best[best < m])  # one rank per component, shared edges once
+            if not len(best):
+                break  # no component has an outgoing edge left
+            edges = order[best]
+            ds.union_many(np.column_stack((u[edges], v[edges])))
+            chosen.append(edges)
+    finally:
+        if pool:
+            pool.shutdown()
+        arrays.clear()  # drop the views before closing the shared blocks
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+    edges = np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+    return (u[edges], v[edges], w[edges]), w[edges].sum()
+
+
+if __name__ == "__main__":
+    import time
+    from mst_kruskal import kruskal_arrays
+
+    # same graph as the adjacency matrix example in spanning_tree.py
+    (mst_u, mst_v, mst_w), total = boruvka(5, [0, 0, 1, 1, 1, 2, 3], [1, 3, 2, 3, 4, 4, 4],
+                                           [2, 6, 3, 8, 5, 7, 9])
+    print(sorted(zip(mst_u.tolist(), mst_v.tolist(), mst_w.tolist())), total)
+    # [(0, 1, 2), (0, 3, 6), (1, 2, 3), (1, 4, 5)] 16
+
+    # random small graphs (duplicate weights, self loops, disconnected), against Kruskal
+    rng = np.random.default_rng(1)
+    for trial in range(200):
+        n, m = int(rng.integers(1, 60)), int(rng.integers(0, 200))
+        u, v, w = rng.integers(0, n, m), rng.integers(0, n, m), rng.integers(0, 5, m)
+        expected = kruskal_arrays(n, u, v, w)[1]
+        for workers in (1, 2) if trial < 10 else (1,):
+            (mst_u, _, _), total = boruvka(n, u, v, w, workers)
+            assert total == expected and len(mst_u) == len(kruskal_arrays(n, u, v, w)[0][0])
+
+    rng = np.random.default_rng(0)
+    n, m = 500_000, 4_000_000
+    u, v, w = rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m)
+
+    _, total_kruskal = kruskal_arrays(n, u, v, w)
+    runs = {'kruskal_arrays': lambda: kruskal_arrays(n, u, v, w)}
+    for workers in sorted({1, 2, os.cpu_count()}):
+        runs[f"boruvka ({workers} workers)"] = lambda workers=workers: boruvka(n, u, v, w, workers)
+    timings = {name: [] for name in runs}
+    for _ in range(3):  # interleaved, median of 3
+        for name, run in runs.items():
+            t0 = time.perf_counter()
+            _, total = run()
+            timings[name].append(time.perf_counter() - t0)
+            assert np.isclose(total, total_kruskal)
+    for name, times in timings.items():
+        print(f"{name}: {sorted(times)[1]:.2f} s, total {total_kruskal:.3f}")
+
+
+# Time Complexity: O(E log V) work in the worst case, log2(V) rounds of
+# O(E_live / P) each on P workers + the argsort for tie-breaking; E_live shrinks
+# every round as edges inside components are dropped.
+# Space Complexity: O(V + E) + a P x V int64 array for the per-task minima.
+
+# Measured with the demo above (V = 500k, E = 4M, random weights), median of 3
+# interleaved runs on a 1-CPU machine:
+#   kruskal_arrays          6.47 s
+#   boruvka (1 worker)      3.26 s
+#   boruvka (2 workers)     3.42 s
+# With one CPU the two workers take turns, so this only shows the overhead of
+# the pool and shared memory (~5%), not a parallel speedup. The version before
+# the shared edge list and the compaction: 3.0-3.4 s (1 worker), 3.5-3.7 s (2).
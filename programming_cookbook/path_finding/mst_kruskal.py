@@ -0,0 +1,119 @@
+# Kruskal on edge arrays:
+# MST() in spanning_tree.py needs a dense V x V matrix, finds the set of a node
+# by scanning every set (O(V) per lookup) and pops from the front of a list
+# (O(E) per pop). Here:
+#   - edges come as three parallel arrays u, v, w (or a CSRGraph),
+#   - one np.argsort gives the processing order (O(E log E) in C),
+#   - an array-backed union-find (union_find.UnionFind) answers
+#     "same component?" in ~O(1) amortised,
+#   - the loop stops as soon as V - 1 edges are taken.
+
+# Streaming variant for edge lists larger than RAM:
+# Kruskal only needs to see the edges once, in weight order, and keeps O(V)
+# state (the union-find). So if the edge file is already sorted by weight
+# (e.g. by an external sort), it can be read in fixed-size chunks with
+# np.memmap and only the current chunk is in memory.
+
+import numpy as np
+
+from union_find import UnionFind
+
+# on-disk edge record: 8 + 8 + 8 = 24 bytes per edge; int64 node ids, so
+# graphs with 2^31 nodes or more don't wrap around (the streaming API is meant
+# for inputs of any size, and the file does not record n)
+EDGE_DTYPE = np.dtype([('u', '<i8'), ('v', '<i8'), ('w', '<f8')])
+
+
+def kruskal_arrays(n, u, v, w):
+    """
+    :param n: number of nodes (ids 0..n-1)
+    :param u, v, w: edge endpoints and weights (undirected)
+    :return: (mst_u, mst_v, mst_w) arrays, total weight
+             (a minimum spanning forest if the graph is disconnected)
+    """
+    order = np.argsort(w, kind='stable')
+    u, v, w = np.asarray(u)[order], np.asarray(v)[order], np.asarray(w)[order]
+    # chunks let the loop stop early once the tree is complete
+    step = 1 << 16
+    chunks = ((u[i:i + step], v[i:i + step], w[i:i + step]) for i in range(0, len(w), step))
+    return _kruskal_sorted(UnionFind(n), chunks)
+
+
+def kruskal_csr(g):
+    """
+    :param g: CSRGraph, every undirected edge stored in one or both directions
+    :return: (mst_u, mst_v, mst_w) arrays over node ids, total weight
+    """
+    sources = np.repeat(np.arange(g.num_nodes), np.diff(g.offsets))
+    return kruskal_arrays(g.num_nodes, sources, g.targets, g.weights)
+
+
+def kruskal_stream(n, chunks):
+    """
+    :param chunks: iterable of (u, v, w) array chunks, globally sorted by weight
+    """
+    return _kruskal_sorted(UnionFind(n), chunks)
+
+
+def _kruskal_sorted(ds, chunks):
+    mst_u, mst_v, mst_w = [], [], []
+    union = ds.union
+    for u, v, w in chunks:
+        for a, b, weight in zip(np.asarray(u).tolist(), np.asarray(v).tolist(),
+                                np.asarray(w).tolist()):
+            if union(a, b):  # if no cycle
+                mst_u.append(a)
+                mst_v.append(b)
+                mst_w.append(weight)
+        if ds.components == 1:
+            break  # spanning tree complete, skip the remaining chunks
+    mst_w = np.array(mst_w, dtype=np.float64)
+    return (np.array(mst_u, dtype=np.int64), np.array(mst_v, dtype=np.int64), mst_w), mst_w.sum()
+
+
+def write_sorted_edges(path, u, v, w):
+    # sorts in memory; for files that don't fit use an external sort on EDGE_DTYPE records
+    records = np.empty(len(w), dtype=EDGE_DTYPE)
+    records['u'], records['v'], records['w'] = u, v, w
+    records = records[np.argsort(records['w'], kind='stable')]
+    records.tofile(path)
+
+
+def read_edge_chunks(path, chunk_edges=1 << 20):
+    # memory-mapped, only one chunk is materialised at a time
+    records = np.memmap(path, dtype=EDGE_DTYPE, mode='r')
+    for start in range(0, len(records), chunk_edges):
+        chunk = np.array(records[start:start + chunk_edges])
+        yield chunk['u'], chunk['v'], chunk['w']
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    # same graph as the adjacency matrix example in spanning_tree.py
+    u = [0, 0, 1, 1, 1, 2, 3]
+    v = [1, 3, 2, 3, 4, 4, 4]
+    w = [2, 6, 3, 8, 5, 7, 9]
+    (mst_u, mst_v, mst_w), total = kruskal_arrays(5, u, v, w)
+    print(list(zip(mst_u.tolist(), mst_v.tolist(), mst_w.tolist())), total)
+    # [(0, 1, 2.0), (1, 2, 3.0), (1, 4, 5.0), (0, 3, 6.0)] 16.0
+
+    rng = np.random.default_rng(0)
+    n, m = 200_000, 2_000_000
+    u, v, w = rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m)
+
+    t0 = time.perf_counter()
+    _, total = kruskal_arrays(n, u, v, w)
+    print(f"in memory: {time.perf_counter() - t0:.2f} s, total {total:.3f}")
+
+    path = os.path.join(tempfile.mkdtemp(), 'edges.bin')
+    write_sorted_edges(path, u, v, w)
+    t0 = time.perf_counter()
+    _, total_stream = kruskal_stream(n, read_edge_chunks(path, chunk_edges=100_000))
+    print(f"streamed:  {time.perf_counter() - t0:.2f} s, total {total_stream:.3f}")
+
+
+# Time Complexity: O(E log E) for the sort + O(E α(V)) for the union-find.
+# Space Complexity: O(V + E) in memory, O(V + chunk) when streaming.
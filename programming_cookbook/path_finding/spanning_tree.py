@@ -52,6 +52,8 @@
 
 
 # without using Union-Find method
+# (O(V) scan per find_node, see mst_kruskal.py for edge-list / CSR input
+#  with an array-backed union-find)
 def MST (adj):
     
     # node nums
@@ -83,8 +85,8 @@ def MST (adj):
     
     mst = []
     mst_nodes = set()
-    while (edge_list):
-        node_i, node_j, edge_weight = edge_list.pop(0)
+    # iterate instead of edge_list.pop(0), which shifts the whole list every time
+    for node_i, node_j, edge_weight in edge_list:
 
         # find if node_i belongs to any set
         node_i_repr = find_node(node_i)
@@ -113,44 +115,35 @@ def MST (adj):
 
     return mst
 
-adj = [
-    [0, 2, 0, 6, 0],
-    [2, 0, 3, 8, 5],
-    [0, 3, 0, 0, 7],
-    [6, 8, 0, 0, 9],
-    [0, 5, 7, 9, 0]
-]
-print(MST(adj))
+if __name__ == "__main__":
+    adj = [
+        [0, 2, 0, 6, 0],
+        [2, 0, 3, 8, 5],
+        [0, 3, 0, 0, 7],
+        [6, 8, 0, 0, 9],
+        [0, 5, 7, 9, 0]
+    ]
+    print(MST(adj))
 
 
 # using Union-Find (Disjoint Set)
-class DisjointSet:
-    def __init__(self, vertices):
-        # Initialize
-        self.parent = {v: v for v in vertices}
-        # use rank to optimize unions
-        self.rank = {v: 0 for v in vertices}
+# The array-backed union-find from union_find.py with label interning
+# (LabelUnionFind): path halving instead of recursive path compression, so
+# long chains can't hit the recursion limit, and no per-node dict entries.
+from union_find import LabelUnionFind
+
 
-    def find(self, node):
-        # Path compression: make representative the parent directly
-        if self.parent[node] != node:
-            self.parent[node] = self.find(self.parent[node])
-        return self.parent[node]
+class DisjointSet(LabelUnionFind):
+    def __init__(self, vertices):
+        vertices = list(vertices)
+        super().__init__(max(len(vertices), 1))
+        for v in vertices:
+            self.id_of(v)
 
     def union(self, u, v):
-        # Union by rank: attach smaller tree under larger tree
-        root_u = self.find(u)
-        root_v = self.find(v)
-        if root_u == root_v:
-            return False  # would form cycle
-        if self.rank[root_u] < self.rank[root_v]:
-            self.parent[root_u] = root_v
-        elif self.rank[root_u] > self.rank[root_v]:
-            self.parent[root_v] = root_u
-        else:
-            self.parent[root_v] = root_u
-            self.rank[root_u] += 1
-        return True
+        # the vertex set is fixed: an unknown vertex is a KeyError, as before
+        ids = self.ids
+        return self.uf.union(ids[u], ids[v])
 
 def kruskal(vertices, edges):
     """
@@ -172,17 +165,18 @@ def kruskal(vertices, edges):
     return mst, total_weight
 
 
-vertices = ['A', 'B', 'C', 'D']
-edges = [
-    (1, 'A', 'B'),
-    (3, 'A', 'C'),
-    (2, 'B', 'C'),
-    (4, 'C', 'D')
-]
+if __name__ == "__main__":
+    vertices = ['A', 'B', 'C', 'D']
+    edges = [
+        (1, 'A', 'B'),
+        (3, 'A', 'C'),
+        (2, 'B', 'C'),
+        (4, 'C', 'D')
+    ]
 
-mst, total_weight = kruskal(vertices, edges)
-print("Edges in MST:", mst)
-print("Total weight:", total_weight)
+    mst, total_weight = kruskal(vertices, edges)
+    print("Edges in MST:", mst)
+    print("Total weight:", total_weight)
 
 
 
@@ -222,14 +216,15 @@ def prim_mst(adj):
     return mst
 
 
-# Example graph (adjacency matrix)
-adj = [
-    [0, 2, 0, 6, 0],
-    [2, 0, 3, 8, 5],
-    [0, 3, 0, 0, 7],
-    [6, 8, 0, 0, 9],
-    [0, 5, 7, 9, 0]
-]
+if __name__ == "__main__":
+    # Example graph (adjacency matrix)
+    adj = [
+        [0, 2, 0, 6, 0],
+        [2, 0, 3, 8, 5],
+        [0, 3, 0, 0, 7],
+        [6, 8, 0, 0, 9],
+        [0, 5, 7, 9, 0]
+    ]
 
-mst = prim_mst(adj)
-print("Edges in MST:", mst)
+    mst = prim_mst(adj)
+    print("Edges in MST:", mst)
@@ -0,0 +1,145 @@
+# Parallel sample sort
+# merge_sort() and quick_sort() run on one core. For a large NumPy array the
+# work can be split across a process pool (threads would serialise on the GIL
+# for anything but NumPy's own C loops):
+
+# 1. Copy the array into shared memory (multiprocessing.shared_memory), every
+#    worker maps the same pages, tasks only carry index ranges.
+# 2. Local sort: the array is cut into P chunks, each worker sorts one chunk
+#    in place.
+# 3. Splitters from sampling: take `oversample` evenly spaced values of every
+#    sorted chunk, sort the P * oversample samples and pick P - 1 splitters at
+#    even ranks. They cut the value range into P buckets of about n / P values.
+# 4. Multiway merge: in each sorted chunk the values of bucket j are one
+#    contiguous slice (np.searchsorted on the splitters). Worker j takes its
+#    slice from all P chunks and merges them (np.sort(kind='stable') of the
+#    concatenation: timsort finds the P sorted runs and merges them). The
+#    output offset of bucket j is the total size of the buckets before it,
+#    so every worker writes its own part of the result, no final merge.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_worker = {}
+
+
+def _share(shape, dtype):
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _attach(specs):
+    # worker initializer: map the input and output arrays, no copy
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker.setdefault('handles', []).append(shm)
+        _worker[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _sort_chunk(bounds):
+    start, end = bounds
+    _worker['data'][start:end].sort()
+
+
+def _merge_bucket(args):
+    pieces, out_start = args
+    data = _worker['data']
+    merged = np.sort(np.concatenate([data[start:end] for start, end in pieces]), kind='stable')
+    _worker['out'][out_start:out_start + len(merged)] = merged
+
+
+def parallel_sort(values, workers=None, oversample=64):
+    """
+    :param values: 1-D NumPy array
+    :param workers: number of processes (default: os.cpu_count()), 1 = np.sort
+    :param oversample: samples per chunk for choosing the splitters
+    :return: sorted copy
+    """
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("parallel_sort() sorts 1-D arrays")
+    workers = workers or os.cpu_count()
+    n = len(values)
+    if workers == 1 or n < workers * oversample:
+        return np.sort(values)
+
+    data_shm, data = _share(values.shape, values.dtype)
+    out_shm, out = _share(values.shape, values.dtype)
+    try:
+        data[:] = values
+        specs = {'data': (data_shm.name, values.shape, values.dtype.str),
+                 'out': (out_shm.name, values.shape, values.dtype.str)}
+        cuts = np.linspace(0, n, workers + 1).astype(np.int64)
+        chunks = list(zip(cuts[:-1].tolist(), cuts[1:].tolist()))
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(specs,)) as pool:
+            list(pool.map(_sort_chunk, chunks))
+
+            # splitters from evenly spaced samples of the sorted chunks
+            samples = np.sort(np.concatenate([
+                data[start + (np.arange(oversample) * (end - start)) // oversample]
+                for start, end in chunks]))
+            splitters = samples[(np.arange(1, workers) * len(samples)) // workers]
+
+            # bounds[i][j] = start of bucket j inside chunk i
+            bounds = [np.concatenate(([start], start + np.searchsorted(data[start:end], splitters),
+                                      [end])) for start, end in chunks]
+            sizes = sum(np.diff(b) for b in bounds)
+            out_starts = np.concatenate(([0], np.cumsum(sizes)[:-1])).tolist()
+            tasks = [([(int(b[j]), int(b[j + 1])) for b in bounds], out_starts[j])
+                     for j in range(workers)]
+            list(pool.map(_merge_bucket, tasks))
+        return out.copy()
+    finally:
+        del data, out
+        for shm in (data_shm, out_shm):
+            shm.close()
+            shm.unlink()
+
+
+def speedup_curve(n=50_000_000, workers_list=(1, 2, 4, 8, 16, 32), dtype=np.float64, seed=0):
+    """
+    Time parallel_sort() for each number of workers against single-process np.sort.
+    :return: list of (workers, seconds, speedup)
+    """
+    import time
+
+    values = np.random.default_rng(seed).random(n).astype(dtype)
+    t0 = time.perf_counter()
+    expected = np.sort(values)
+    baseline = time.perf_counter() - t0
+    curve = []
+    print(f"n = {n}, np.sort: {baseline:.2f} s, {os.cpu_count()} CPU(s)")
+    for workers in workers_list:
+        t0 = time.perf_counter()
+        result = parallel_sort(values, workers)
+        seconds = time.perf_counter() - t0
+        assert np.array_equal(result, expected)
+        curve.append((workers, seconds, baseline / seconds))
+        print(f"{workers:>3} workers: {seconds:>7.2f} s  speedup {baseline / seconds:>5.2f}x")
+    return curve
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    for n in (0, 1, 100, 10_001):
+        for dtype in (np.int64, np.float32):
+            a = rng.integers(-50, 50, n).astype(dtype)  # many duplicates
+            assert np.array_equal(parallel_sort(a, workers=3, oversample=8), np.sort(a))
+
+    speedup_curve(n=20_000_000, workers_list=(1, 2, 4, 8))
+
+
+# Time Complexity: O((n / P) log n) per worker + O(P² log n) in the parent for
+# the splitters and bucket bounds, + two O(n) copies (into and out of shared memory).
+# Space Complexity: O(n) shared (input + output) + O(n / P) per worker.
+# Buckets hold ~n / P values each for distinct values; a value repeated more
+# than n / P times falls into one bucket, that worker then does more of the merge.
+
+# Speedup needs as many cores as workers. speedup_curve() prints the table for
+# 1-32 workers; on the 1-CPU machine these numbers were taken on, extra workers
+# can only add overhead (n = 2 * 10^7 float64):
+# np.sort 0.41 s; 1 worker 0.45 s, 2 workers 1.28 s, 4 workers 1.50 s, 8 workers 1.94 s.